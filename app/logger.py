@@ -1,24 +1,47 @@
 import sys
+import threading
 from datetime import datetime
+from typing import Callable, Dict
 from loguru import logger as _logger
 from app.config import PROJECT_ROOT
 
 _print_level = "INFO"
-_log_callbacks = []
+_log_config = None
+_log_callbacks: Dict[int, Callable] = {}
+_next_id = 0
+_callbacks_lock = threading.Lock()
+_intercept_installed = False
 
 def add_log_callback(callback):
     """Register a callback to receive log messages"""
-    _log_callbacks.append(callback)
-    return len(_log_callbacks) - 1  # Return index as ID
+    global _next_id, _intercept_installed
+    with _callbacks_lock:
+        if not _intercept_installed:
+            # Install the interceptor on first use so logging pays nothing
+            # for it until somebody subscribes
+            _logger.configure(patcher=_intercept_message)
+            _intercept_installed = True
+        callback_id = _next_id
+        _next_id += 1
+        _log_callbacks[callback_id] = callback
+    return callback_id
 
 def remove_log_callback(callback_id):
     """Remove a callback by its ID"""
-    if 0 <= callback_id < len(_log_callbacks):
-        _log_callbacks[callback_id] = None
+    with _callbacks_lock:
+        _log_callbacks.pop(callback_id, None)
 
 def define_log_level(print_level="INFO", logfile_level="DEBUG", name: str = None):
-    """Adjust the log level to above level"""
-    global _print_level
+    """Adjust the log level to above level.
+
+    Calling it again with the current arguments returns the existing logger
+    instead of replacing the sinks and opening a new log file.
+    """
+    global _print_level, _log_config
+    log_config = (print_level, logfile_level, name)
+    if log_config == _log_config:
+        return _logger
+    _log_config = log_config
     _print_level = print_level
 
     current_date = datetime.now()
@@ -26,6 +49,7 @@ def define_log_level(print_level="INFO", logfile_level="DEBUG", name: str = None
     log_name = (
         f"{name}_{formatted_date}" if name else formatted_date
     )  # name a log with prefix name
+    log_path = PROJECT_ROOT / f"logs/{log_name}.log"
 
     # Make sure to remove only if handlers exist
     try:
@@ -34,25 +58,28 @@ def define_log_level(print_level="INFO", logfile_level="DEBUG", name: str = None
         pass  # No handlers to remove, that's okay
 
     _logger.add(sys.stderr, level=print_level)
-    _logger.add(PROJECT_ROOT / f"logs/{log_name}.log", level=logfile_level)
+    # Write the log file from loguru's background worker so logging from the
+    # request path never blocks on disk I/O
+    _logger.add(log_path, level=logfile_level, enqueue=True)
 
     return _logger
 
 # Intercept function for the logger
 def _intercept_message(record):
+    if not _log_callbacks:
+        return record
+
     message = record["message"]
-    # Call all registered callbacks
-    for callback in _log_callbacks:
-        if callback:  # Skip None callbacks (removed ones)
-            callback(message)
+    # Snapshot the callbacks so the lock isn't held while they run
+    with _callbacks_lock:
+        callbacks = list(_log_callbacks.values())
+    for callback in callbacks:
+        callback(message)
     return record
 
 # Create the logger instance
 logger = define_log_level()
 
-# Apply the interception to capture messages
-logger = logger.patch(_intercept_message)
-
 if __name__ == "__main__":
     logger.info("Starting application")
     logger.debug("Debug message")
@@ -1,10 +1,171 @@
-import yfinance as yf
-from typing import Optional, List, Dict, Any
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Union
+
+import yfinance
+
+try:
+    # yfinance-cache is a drop-in wrapper that persists responses on disk
+    # and only re-contacts Yahoo when the cached data is stale
+    import yfinance_cache as yf
+except ImportError:
+    yf = yfinance
 
 from app.tool import BaseTool
 from app.tool.base import CLIResult, ToolResult
 from pydantic import Field
 
+# Time-to-live (seconds) for cached Yahoo Finance responses
+_PRICE_TTL = 60
+_INFO_TTL = 6 * 60 * 60
+
+# Upper bound on the number of symbols each cache holds; search queries are
+# free text, so without a bound a long-running server would grow forever
+_MAX_CACHE_ENTRIES = 256
+
+# Maximum number of concurrent price lookups for the batch 'prices' action
+_MAX_PRICE_WORKERS = 8
+
+# Module-level caches keyed by upper-cased ticker symbol
+_ticker_cache: Dict[str, yf.Ticker] = {}
+_info_cache: Dict[str, tuple[float, dict]] = {}
+_history_cache: Dict[str, Dict[str, tuple[float, Any]]] = {}
+_quote_cache: Dict[str, tuple[float, dict]] = {}
+
+# The tool's helpers run in worker threads, so every cache access goes through this lock
+_cache_lock = threading.Lock()
+
+
+def _store(cache: dict, key: str, value: Any) -> None:
+    """Store value under key, evicting the oldest entries once the cache is full.
+
+    Callers must hold _cache_lock.
+    """
+    cache.pop(key, None)
+    while len(cache) >= _MAX_CACHE_ENTRIES:
+        del cache[next(iter(cache))]
+    cache[key] = value
+
+
+def _cache_get(cache: dict, key: str) -> Any:
+    """Return the cached value for key, or None."""
+    with _cache_lock:
+        return cache.get(key)
+
+
+def _cache_set(cache: dict, key: str, value: Any) -> None:
+    """Store value under key in a bounded cache."""
+    with _cache_lock:
+        _store(cache, key, value)
+
+
+def _get_ticker(ticker: str) -> yf.Ticker:
+    """Return a cached yf.Ticker instance for the given symbol."""
+    key = ticker.upper()
+    with _cache_lock:
+        stock = _ticker_cache.get(key)
+        if stock is None:
+            stock = yf.Ticker(key)
+            _store(_ticker_cache, key, stock)
+    return stock
+
+
+def _get_info(ticker: str, ttl: float = _INFO_TTL) -> dict:
+    """Return the .info dict for a ticker, re-fetching only once it is older than ttl."""
+    key = ticker.upper()
+    cached = _cache_get(_info_cache, key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    # Ticker memoizes .info on the instance, so drop the cached Ticker to
+    # make the re-fetch actually contact Yahoo again
+    with _cache_lock:
+        _ticker_cache.pop(key, None)
+    info = _get_ticker(key).info
+    if info:
+        _cache_set(_info_cache, key, (time.monotonic(), info))
+    return info
+
+
+def _history_periods(key: str) -> Dict[str, tuple[float, Any]]:
+    """Return the per-period history cache for an upper-cased ticker symbol."""
+    with _cache_lock:
+        periods = _history_cache.get(key)
+        if periods is None:
+            periods = {}
+            _store(_history_cache, key, periods)
+    return periods
+
+
+def _get_cached_history(key: str, period: str, ttl: float = _PRICE_TTL):
+    """Return the cached history DataFrame for a ticker and period if still fresh, else None."""
+    with _cache_lock:
+        cached = _history_cache.get(key, {}).get(period)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+    return None
+
+
+def _get_history(ticker: str, period: str, ttl: float = _PRICE_TTL):
+    """Return the price history DataFrame for a ticker and period, cached for ttl seconds."""
+    key = ticker.upper()
+    hist = _get_cached_history(key, period, ttl)
+    if hist is not None:
+        return hist
+
+    hist = _get_ticker(key).history(period=period)
+    if not hist.empty:
+        _cache_set(_history_periods(key), period, (time.monotonic(), hist))
+    return hist
+
+
+def _get_quote(ticker: str, ttl: float = _PRICE_TTL) -> dict:
+    """Return a price snapshot built from fast_info instead of the heavy .info scrape."""
+    key = ticker.upper()
+    cached = _cache_get(_quote_cache, key)
+    if cached and time.monotonic() - cached[0] < ttl:
+        return cached[1]
+
+    # FastInfo memoizes its values on the Ticker, so a fresh plain yfinance
+    # Ticker is used here to let the price expire along with the TTL
+    stock = yfinance.Ticker(key)
+    fast_info = stock.fast_info
+    quote = {
+        "current_price": fast_info.last_price,
+        "previous_close": fast_info.previous_close,
+        "open": fast_info.open,
+        "day_high": fast_info.day_high,
+        "day_low": fast_info.day_low,
+        "currency": fast_info.currency,
+    }
+
+    try:
+        # fast_info already loaded the price history, so its metadata is free
+        quote["name"] = stock.get_history_metadata().get("shortName")
+    except Exception:
+        quote["name"] = None
+
+    if quote["current_price"]:
+        _cache_set(_quote_cache, key, (time.monotonic(), quote))
+    return quote
+
+
+def _format_price(value: Any) -> str:
+    """Format a price with two decimals, leaving placeholders such as 'Unknown' as-is."""
+    if isinstance(value, (int, float)):
+        return f"{value:.2f}"
+    return str(value)
+
+
+def _normalize_tickers(tickers: Union[str, List[str]]) -> List[str]:
+    """Turn a list or a comma/space separated string into unique upper-cased symbols."""
+    if isinstance(tickers, str):
+        tickers = tickers.replace(",", " ").split()
+    return list(dict.fromkeys(t.strip().upper() for t in tickers if t and t.strip()))
+
+
 class YFinanceTool(BaseTool):
     """Tool for fetching stock and financial information using yfinance."""
 
@@ -25,8 +186,8 @@ class YFinanceTool(BaseTool):
         """Execute financial data retrieval based on the specified action.
 
         Args:
-            action: The action to perform ('price', 'info', 'history', 'search')
-            ticker: Stock ticker symbol (e.g., AAPL, MSFT, GOOGL)
+            action: The action to perform ('price', 'prices', 'info', 'history', 'histories', 'search')
+            ticker: Stock ticker symbol (e.g., AAPL) or a list of symbols for batch actions
             period: Time period for historical data (e.g., 1d, 1mo, 1y)
             query: Search term for stock search
             limit: Maximum number of results for search
@@ -44,7 +205,7 @@ class YFinanceTool(BaseTool):
 
             if not action:
                 return ToolResult(
-                    error="Missing required parameter: 'action'. Choose from: price, info, history, search"
+                    error="Missing required parameter: 'action'. Choose from: price, prices, info, history, histories, search"
                 )
 
             if not ticker and action != 'search':
@@ -52,20 +213,41 @@ class YFinanceTool(BaseTool):
                     error="Missing required parameter: 'ticker'"
                 )
 
+            # A list of tickers for a single-ticker action is served by the batch variant
+            if isinstance(ticker, list):
+                if len(ticker) == 1:
+                    ticker = ticker[0]
+                elif action == "price":
+                    action = "prices"
+                elif action == "history":
+                    action = "histories"
+                elif action == "info" or (action == "search" and not query):
+                    return ToolResult(
+                        error=f"Action '{action}' takes a single ticker, got {len(ticker)}"
+                    )
+
+            # yfinance does blocking HTTP requests, so run the helpers in a
+            # worker thread to keep the event loop responsive
             if action == "price":
-                result = self.get_stock_price(ticker)
+                result = await asyncio.to_thread(self.get_stock_price, ticker)
+            elif action == "prices":
+                result = await asyncio.to_thread(self.get_stock_prices, _normalize_tickers(ticker))
             elif action == "info":
-                result = self.get_company_info(ticker)
+                result = await asyncio.to_thread(self.get_company_info, ticker)
             elif action == "history":
-                result = self.get_stock_history(ticker, period)
+                result = await asyncio.to_thread(self.get_stock_history, ticker, period)
+            elif action == "histories":
+                result = await asyncio.to_thread(
+                    self.get_stock_histories, _normalize_tickers(ticker), period
+                )
             elif action == "search":
-                result = self.search_stocks(query or ticker, limit)
+                result = await asyncio.to_thread(self.search_stocks, query or ticker, limit)
             else:
                 return ToolResult(
-                    error=f"Invalid action: {action}. Choose from: price, info, history, search"
+                    error=f"Invalid action: {action}. Choose from: price, prices, info, history, histories, search"
                 )
 
-            if isinstance(result, str) and action in ["price", "info", "history", "search"]:
+            if isinstance(result, str):
                 result += "\n\n---\nFinancial data retrieval complete. If this was the only task, please call the terminate tool when you're done with all tasks."
 
             return ToolResult(output=result)
@@ -82,8 +264,7 @@ class YFinanceTool(BaseTool):
             String containing formatted company information
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            info = _get_info(ticker)
 
             if not info:
                 return f"Unable to fetch information for ticker: {ticker}"
@@ -119,38 +300,109 @@ class YFinanceTool(BaseTool):
             String containing summary of historical stock data
         """
         try:
-            stock = yf.Ticker(ticker)
-            hist = stock.history(period=period)
+            hist = _get_history(ticker, period)
 
             if hist.empty:
                 return f"No historical data available for {ticker} over period {period}"
 
-            # Get basic stats
-            start_price = hist['Close'].iloc[0]
-            end_price = hist['Close'].iloc[-1]
-            change = end_price - start_price
-            pct_change = (change / start_price) * 100
-            high = hist['High'].max()
-            low = hist['Low'].min()
-
-            # Format the result
-            result = f"Stock History for {ticker} (Period: {period}):\n\n"
-            result += f"Start Price: ${start_price:.2f}\n"
-            result += f"End Price: ${end_price:.2f}\n"
-            result += f"Change: ${change:.2f} ({pct_change:.2f}%)\n"
-            result += f"Highest Price: ${high:.2f}\n"
-            result += f"Lowest Price: ${low:.2f}\n\n"
-
-            # Include a sample of the data
-            result += "Recent price data (last 5 days if available):\n"
-            sample = hist.tail(5)
-            for date, row in sample.iterrows():
-                result += f"{date.date()}: Open ${row['Open']:.2f}, Close ${row['Close']:.2f}, Volume {int(row['Volume'])}\n"
-
-            return result
+            return self._format_history(ticker, period, hist)
         except Exception as e:
             return f"Error fetching stock history for {ticker}: {str(e)}"
 
+    def get_stock_histories(self, tickers: List[str], period: str = "1mo") -> str:
+        """Get historical stock price data for several tickers in one batch download.
+
+        Tickers with fresh data in the history cache are served from it; only
+        the stale or missing ones are downloaded.
+
+        Args:
+            tickers: List of stock ticker symbols
+            period: Time period (1d, 5d, 1mo, 3mo, 6mo, 1y, 2y, 5y, 10y, ytd, max)
+
+        Returns:
+            String containing a history summary for each ticker
+        """
+        if not tickers:
+            return "No tickers provided"
+
+        histories = {ticker: _get_cached_history(ticker, period) for ticker in tickers}
+        stale = [ticker for ticker, hist in histories.items() if hist is None]
+
+        data = None
+        download_error = None
+        if stale:
+            try:
+                data = yfinance.download(
+                    stale, period=period, threads=True, group_by="ticker", progress=False
+                )
+            except Exception as e:
+                download_error = str(e)
+
+        sections = []
+        for ticker in tickers:
+            if histories[ticker] is not None:
+                sections.append(self._format_history(ticker, period, histories[ticker]))
+                continue
+            if download_error is not None:
+                sections.append(f"Error fetching stock history for {ticker}: {download_error}")
+                continue
+
+            try:
+                if data.columns.nlevels > 1:
+                    if ticker not in data.columns.get_level_values(0):
+                        sections.append(f"No historical data available for {ticker} over period {period}")
+                        continue
+                    hist = data[ticker]
+                else:
+                    hist = data
+                hist = hist.dropna(subset=["Close"])
+
+                if hist.empty:
+                    sections.append(f"No historical data available for {ticker} over period {period}")
+                    continue
+
+                _cache_set(_history_periods(ticker), period, (time.monotonic(), hist))
+                sections.append(self._format_history(ticker, period, hist))
+            except Exception as e:
+                sections.append(f"Error fetching stock history for {ticker}: {str(e)}")
+
+        return "\n".join(sections)
+
+    def _format_history(self, ticker: str, period: str, hist) -> str:
+        """Format a price history DataFrame into a readable summary."""
+        # Get basic stats
+        start_price = hist['Close'].iloc[0]
+        end_price = hist['Close'].iloc[-1]
+        change = end_price - start_price
+        pct_change = (change / start_price) * 100
+        high = hist['High'].max()
+        low = hist['Low'].min()
+
+        # Format the result
+        result = f"Stock History for {ticker} (Period: {period}):\n\n"
+        result += f"Start Price: ${start_price:.2f}\n"
+        result += f"End Price: ${end_price:.2f}\n"
+        result += f"Change: ${change:.2f} ({pct_change:.2f}%)\n"
+        result += f"Highest Price: ${high:.2f}\n"
+        result += f"Lowest Price: ${low:.2f}\n\n"
+
+        # Include a sample of the data
+        result += "Recent price data (last 5 days if available):\n"
+        sample = hist.tail(5)
+        # Read the columns as plain arrays instead of boxing every row into a Series
+        rows = zip(
+            sample.index.date,
+            sample['Open'].to_numpy(),
+            sample['Close'].to_numpy(),
+            sample['Volume'].to_numpy(),
+        )
+        result += "".join(
+            f"{date}: Open ${open_:.2f}, Close ${close:.2f}, Volume {int(volume)}\n"
+            for date, open_, close, volume in rows
+        )
+
+        return result
+
     def search_stocks(self, query: str, limit: int = 5) -> str:
         """Search for stocks by name or ticker.
 
@@ -162,8 +414,7 @@ class YFinanceTool(BaseTool):
             String containing search results
         """
         try:
-            ticker = yf.Ticker(query)
-            info = ticker.info
+            info = _get_info(query)
 
             if not info or 'symbol' not in info:
                 return f"No stocks found matching '{query}'"
@@ -193,35 +444,50 @@ class YFinanceTool(BaseTool):
             String containing the current stock price information
         """
         try:
-            stock = yf.Ticker(ticker)
-            info = stock.info
+            quote = _get_quote(ticker)
 
-            if not info:
-                return f"Unable to fetch information for ticker: {ticker}"
+            current_price = quote['current_price']
+            company_name = quote['name'] or ticker
+            currency = quote['currency'] or 'USD'
+            previous_close = quote['previous_close'] or 'Unknown'
+            open_price = quote['open'] or 'Unknown'
+            day_high = quote['day_high'] or 'Unknown'
+            day_low = quote['day_low'] or 'Unknown'
 
-            current_price = info.get('currentPrice', info.get('regularMarketPrice'))
             if not current_price:
                 return f"Price information not available for {ticker}"
 
-            company_name = info.get('shortName', ticker)
-            currency = info.get('currency', 'USD')
-
-            # Add more price information
-            previous_close = info.get('previousClose', 'Unknown')
-            open_price = info.get('open', 'Unknown')
-            day_high = info.get('dayHigh', 'Unknown')
-            day_low = info.get('dayLow', 'Unknown')
-
-            result = f"{company_name} ({ticker}) current price: {current_price} {currency}\n"
+            result = f"{company_name} ({ticker}) current price: {_format_price(current_price)} {currency}\n"
             if previous_close != 'Unknown':
                 change = current_price - previous_close
                 pct_change = (change / previous_close) * 100
                 result += f"Change: {change:.2f} ({pct_change:.2f}%)\n"
 
-            result += f"Previous Close: {previous_close} {currency}\n"
-            result += f"Open: {open_price} {currency}\n"
-            result += f"Day Range: {day_low} - {day_high} {currency}"
+            result += f"Previous Close: {_format_price(previous_close)} {currency}\n"
+            result += f"Open: {_format_price(open_price)} {currency}\n"
+            result += f"Day Range: {_format_price(day_low)} - {_format_price(day_high)} {currency}"
 
             return result
         except Exception as e:
             return f"Error fetching stock price for {ticker}: {str(e)}"
+
+    def get_stock_prices(self, tickers: List[str]) -> str:
+        """Get the current stock price for several tickers concurrently.
+
+        Each ticker goes through get_stock_price, so the batch shares its quote
+        cache and output format. The lookups run in a thread pool so their
+        round trips overlap instead of running one after another.
+
+        Args:
+            tickers: List of stock ticker symbols
+
+        Returns:
+            String containing the current price information of each ticker
+        """
+        if not tickers:
+            return "No tickers provided"
+
+        with ThreadPoolExecutor(max_workers=min(len(tickers), _MAX_PRICE_WORKERS)) as pool:
+            results = list(pool.map(self.get_stock_price, tickers))
+
+        return "\n\n".join(results)
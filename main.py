@@ -32,77 +32,26 @@ async def process(request: PromptRequest):
 
     # Create async stream for SSE
     async def event_stream():
-        # Create a queue for messages
-        queue = asyncio.Queue()
+        loop = asyncio.get_running_loop()
 
-        # Register a callback to capture all log messages
-        def log_callback(message):
-            asyncio.create_task(queue.put(message))
-
-        callback_id = add_log_callback(log_callback)
-
-        agent = Manus()
-
-        try:
-            if not prompt.strip():
-                logger.warning("Empty prompt provided.")
-                yield "data: Empty prompt provided.\n\n"
-                return
-
-            # Log a starting message
-            logger.info("Processing your request...")
-
-            # Start the agent task
-            agent_task = asyncio.create_task(agent.run(prompt))
-
-            # Stream messages until agent is done
-            while not agent_task.done() or not queue.empty():
-                try:
-                    # Try to get a message from the queue, but don't block indefinitely
-                    message = await asyncio.wait_for(queue.get(), timeout=0.1)
-                    yield f"data: {message}\n\n"
-                except asyncio.TimeoutError:
-                    # No message received in the timeout period, continue the loop
-                    if agent_task.done() and queue.empty():
-                        break
-
-            # Wait for agent to complete if it's not done yet
-            if not agent_task.done():
-                await agent_task
-
-            # Final message
-            logger.info("Request processing completed.")
-            yield "data: Request processing completed.\n\n"
-
-        except Exception as e:
-            error_msg = f"An error occurred: {str(e)}"
-            logger.error(error_msg)
-            yield f"data: {error_msg}\n\n"
-        finally:
-            # Clean up the callback
-            remove_log_callback(callback_id)
-            await agent.cleanup()
-
-    return StreamingResponse(event_stream(), media_type="text/event-stream")
+        # Create a bounded queue for messages
+        queue = asyncio.Queue(maxsize=1024)
 
+        # Number of log messages dropped since the client was last told
+        dropped = 0
 
-# Define a Pydantic model for the incoming request
-class PromptRequest(BaseModel):
-    prompt: str
+        def enqueue(message):
+            nonlocal dropped
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # Drop the message rather than grow without bound for a slow client
+                dropped += 1
 
-
-@app.post("/process/")
-async def process(request: PromptRequest):
-    prompt = request.prompt
-
-    # Create async stream for SSE
-    async def event_stream():
-        # Create a queue for messages
-        queue = asyncio.Queue()
-
-        # Register a callback to capture all log messages
+        # Register a callback to capture all log messages. Loguru may invoke it
+        # from any thread, so hand the message over to the event loop thread.
         def log_callback(message):
-            asyncio.create_task(queue.put(message))
+            loop.call_soon_threadsafe(enqueue, message)
 
         callback_id = add_log_callback(log_callback)
 
@@ -117,23 +66,33 @@ async def process(request: PromptRequest):
             # Log a starting message
             logger.info("Processing your request...")
 
-            # Start the agent task
-            agent_task = asyncio.create_task(agent.run(prompt))
+            # Start the agent task and push a None sentinel once it finishes.
+            # queue.put waits for free space, so the sentinel is never dropped.
+            # The event loop only keeps weak references to tasks, so hold on
+            # to the sentinel task until it has run.
+            sentinel_tasks = set()
 
-            # Stream messages until agent is done
-            while not agent_task.done() or not queue.empty():
-                try:
-                    # Try to get a message from the queue, but don't block indefinitely
-                    message = await asyncio.wait_for(queue.get(), timeout=0.1)
-                    yield f"data: {message}\n\n"
-                except asyncio.TimeoutError:
-                    # No message received in the timeout period, continue the loop
-                    if agent_task.done() and queue.empty():
-                        break
-
-            # Wait for agent to complete if it's not done yet
-            if not agent_task.done():
-                await agent_task
+            def push_sentinel(_):
+                sentinel_task = loop.create_task(queue.put(None))
+                sentinel_tasks.add(sentinel_task)
+                sentinel_task.add_done_callback(sentinel_tasks.discard)
+
+            agent_task = asyncio.create_task(agent.run(prompt))
+            agent_task.add_done_callback(push_sentinel)
+
+            # Stream messages until the sentinel arrives
+            while True:
+                message = await queue.get()
+                if dropped:
+                    # Reset before yielding so drops during the send are kept
+                    count, dropped = dropped, 0
+                    yield f"data: [{count} log messages dropped]\n\n"
+                if message is None:
+                    break
+                yield f"data: {message}\n\n"
+
+            # Surface any exception raised by the agent
+            await agent_task
 
             # Final message
             logger.info("Request processing completed.")